@@ -1,12 +1,15 @@
 import argparse
-from datetime import datetime
+from datetime import date
 import json
 import os
 from json import JSONDecodeError
 import sys
 
-# File where all expenses are stored as JSON
-EXPENSE_TRACKER_FILE = 'expensetracker.json'
+# File where all expenses are stored as JSON Lines (one expense per line)
+EXPENSE_TRACKER_FILE = 'expensetracker.jsonl'
+
+# Older versions stored everything as a single JSON array in this file
+LEGACY_EXPENSE_TRACKER_FILE = 'expensetracker.json'
 
 
 # ---------- Helper validator functions for argparse ----------
@@ -56,30 +59,70 @@ class ExpenseTracker:
     """Handles loading, saving, and operating on expense data."""
 
     def __init__(self):
-        # Load expenses from file into a list when the object is created
+        # Load expenses from file into a dict keyed by ID when the object is created
         self.expense = self.load_json()
+        # Highest ID seen so far, so get_id() doesn't have to scan the expenses
+        self._max_id = max(self.expense, default=0)
 
     def load_json(self):
         """
-        Loads the JSON file.
-        - If file doesn't exist, creates an empty one.
-        - If file is corrupted, resets it to an empty list.
-        Returns: list of expenses.
+        Loads the JSON Lines file.
+        - If file doesn't exist, migrates the old JSON array file
+          (if present) or creates an empty one.
+        - If a line is corrupted (e.g. a half-written last line after a crash),
+          skips just that line and rewrites the file without it.
+        Returns: dict of expenses keyed by ID (in file order).
         """
         if not os.path.exists(EXPENSE_TRACKER_FILE):
-            # If file does not exist, create an empty list file
-            with open(EXPENSE_TRACKER_FILE, 'w') as f:
-                json.dump([], f, indent=4)
-            return []
-
-        try:
-            with open(EXPENSE_TRACKER_FILE, 'r') as json_file:
-                return json.load(json_file)
-        except JSONDecodeError:
-            # If JSON is invalid/corrupt, reset it
-            with open(EXPENSE_TRACKER_FILE, 'w') as json_file:
-                json.dump([], json_file, indent=4)
-            return []
+            return self.migrate_legacy_json()
+
+        # Read the whole file in one call, then parse it line by line
+        with open(EXPENSE_TRACKER_FILE, 'r') as json_file:
+            content = json_file.read()
+        lines = content.splitlines()
+
+        # If the last line has no newline (e.g. a hand-edited file), add one now,
+        # otherwise the next append_json() would glue a record onto that line
+        if content and not content.endswith("\n"):
+            with open(EXPENSE_TRACKER_FILE, 'a') as json_file:
+                json_file.write("\n")
+
+        self.expense = {}
+        bad_lines = 0
+        for line in lines:
+            # Skip blank lines so a trailing newline never breaks loading
+            if not line.strip():
+                continue
+            try:
+                expense = json.loads(line)
+            except JSONDecodeError:
+                bad_lines += 1
+                continue
+            self.expense[expense['id']] = expense
+
+        if bad_lines:
+            # Drop only the broken line(s), so the next append starts on a clean line
+            print(f"⚠️ Warning: skipped {bad_lines} corrupted line(s) in {EXPENSE_TRACKER_FILE}.")
+            self.save_json()
+        return self.expense
+
+    def migrate_legacy_json(self):
+        """
+        Converts the old single-array JSON file into the JSON Lines format.
+        - If there is no old file (or it is corrupted), creates an empty file.
+        Returns: dict of expenses keyed by ID.
+        """
+        expenses = []
+        if os.path.exists(LEGACY_EXPENSE_TRACKER_FILE):
+            try:
+                with open(LEGACY_EXPENSE_TRACKER_FILE, 'r') as json_file:
+                    expenses = json.loads(json_file.read())
+            except JSONDecodeError:
+                expenses = []
+
+        self.expense = {expense['id']: expense for expense in expenses}
+        self.save_json()
+        return self.expense
 
     def get_id(self) -> int:
         """
@@ -87,14 +130,26 @@ class ExpenseTracker:
         - If there are no expenses, returns 1.
         - Otherwise, returns max existing ID + 1.
         """
-        if not self.expense:
-            return 1
-        return max(item['id'] for item in self.expense) + 1
+        return self._max_id + 1
 
     def save_json(self):
-        """Writes the current in-memory expense list back to the JSON file."""
-        with open(EXPENSE_TRACKER_FILE, 'w') as json_file:
-            json.dump(self.expense, json_file, indent=4)
+        """
+        Rewrites the whole file from the in-memory expenses.
+        Only needed when existing records change (e.g. delete);
+        new expenses are appended with append_json().
+        """
+        # Encode once and write in a single call, to a temporary file first
+        # and then swap it in, so a crash never leaves a half-written file
+        data = "".join(json.dumps(expense) + "\n" for expense in self.expense.values())
+        tmp_file = EXPENSE_TRACKER_FILE + '.tmp'
+        with open(tmp_file, 'w') as json_file:
+            json_file.write(data)
+        os.replace(tmp_file, EXPENSE_TRACKER_FILE)
+
+    def append_json(self, expense: dict):
+        """Appends a single expense as one line at the end of the file."""
+        with open(EXPENSE_TRACKER_FILE, 'a') as json_file:
+            json_file.write(json.dumps(expense) + "\n")
 
     def add_expense(self, description: str, amount: float):
         """
@@ -105,12 +160,14 @@ class ExpenseTracker:
         """
         exp = {
             'id': self.get_id(),
-            'date': datetime.today().strftime('%Y-%m-%d'),
+            # isoformat() is always YYYY-MM-DD and skips strftime's format parsing
+            'date': date.today().isoformat(),
             'description': description,
             'amount': amount
         }
-        self.expense.append(exp)
-        self.save_json()
+        self._max_id = exp['id']
+        self.expense[exp['id']] = exp
+        self.append_json(exp)
         print(f"✅ Expense added successfully. ID({exp['id']})")
 
     def list_expense(self):
@@ -122,28 +179,33 @@ class ExpenseTracker:
             return
 
         # Header row
-        print(f"{'ID':<5}{'Date':<15}{'Description':<30}{'Amount':>10}")
-        print("-" * 60)
+        rows = [
+            f"{'ID':<5}{'Date':<15}{'Description':<30}{'Amount':>10}",
+            "-" * 60,
+        ]
 
         # Data rows
-        for expense in self.expense:
+        for expense in self.expense.values():
             desc = expense['description']
             # Truncate very long descriptions for neat output
             if len(desc) > 27:
                 desc = desc[:27] + "..."
 
-            print(
+            rows.append(
                 f"{expense['id']:<5}"
                 f"{expense['date']:<15}"
                 f"{desc:<30}"
                 f"{expense['amount']:>10.2f}"
             )
 
+        # Build the whole table first, then write it out in one go
+        sys.stdout.write("\n".join(rows) + "\n")
+
     def print_summary(self):
         """
         Prints the total of all expenses.
         """
-        total = float(sum(expense['amount'] for expense in self.expense))
+        total = float(sum(expense['amount'] for expense in self.expense.values()))
         print(f"💰 Total Expenses: ${total:.2f}")
 
     def delete_expense(self, id: int):
@@ -156,26 +218,26 @@ class ExpenseTracker:
             print("❌ Error: Please provide --id for 'delete' command.")
             return
 
-        for expense in self.expense:
-            if expense['id'] == id:
-                self.expense.remove(expense)
-                self.save_json()
-                print("✅ Expense deleted successfully.")
-                return
+        # Expenses are keyed by ID, so this is a single dict lookup
+        expense = self.expense.pop(id, None)
+        if expense is None:
+            print(f"❌ Error: Expense with ID {id} does not exist.")
+            return
 
-        print(f"❌ Error: Expense with ID {id} does not exist.")
+        self.save_json()
+        print("✅ Expense deleted successfully.")
 
     def print_monthly_expense(self, month: int):
         """
         Prints the total expense for a given month (1-12),
         across all years.
         """
-        total = 0.0
-        for expense in self.expense:
-            # Assumes date format is always 'YYYY-MM-DD'
-            check_month = int(expense['date'].split('-')[1])
-            if check_month == month:
-                total += expense['amount']
+        # Assumes date format is always 'YYYY-MM-DD', so the month is date[5:7]
+        month_str = f"{month:02d}"
+        total = float(sum(
+            expense['amount'] for expense in self.expense.values()
+            if expense['date'][5:7] == month_str
+        ))
 
         print(f"📅 Total Expense for month {month}: ${total:.2f}")
 
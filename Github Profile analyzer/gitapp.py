@@ -1,5 +1,7 @@
 import json
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import requests
 
 # Output file names
@@ -18,18 +20,25 @@ class GitHub:
 
     BASE_URL = "https://api.github.com"
 
-    def _get(self, path: str):
+    def __init__(self):
+        # One session for all requests so TCP/TLS connections are reused
+        self.session = requests.Session()
+
+    def _get_bytes(self, path: str):
         """
-        Internal helper to perform a GET request and return JSON data.
+        Internal helper to perform a GET request and return the raw body.
+
+        The body is already JSON, so it is saved as-is instead of being
+        parsed here and re-encoded on save.
 
         :param path: API path, e.g. "users/octocat/repos"
-        :return: Parsed JSON (dict or list) or None if error.
+        :return: Response body (bytes) or None if error.
         """
         url = f"{self.BASE_URL}/{path}"
-        response = requests.get(url)
+        response = self.session.get(url)
 
         if response.status_code == 200:
-            return response.json()
+            return response.content
         else:
             # Print error and return None instead of killing the program
             print(f"Error {response.status_code} for URL: {url}")
@@ -48,19 +57,20 @@ class GitHub:
         :return: Parsed JSON or None if file not found / invalid
         """
         try:
-            with open(filename, "r") as json_file:
-                return json.load(json_file)
+            # Read the whole file in one call; json.loads accepts bytes directly
+            with open(filename, "rb") as json_file:
+                return json.loads(json_file.read())
         except FileNotFoundError:
             print(f"File not found: {filename}")
         except json.JSONDecodeError:
             print(f"Invalid JSON in: {filename}")
         return None
 
-    def _save_json(self, data, filename: str):
+    def _save_bytes(self, data, filename: str):
         """
-        Internal helper to save JSON data to a file.
+        Internal helper to save a raw JSON response body to a file.
 
-        :param data: JSON-serializable data (dict or list)
+        :param data: Response body (bytes)
         :param filename: Path to output file
         """
         if data is None:
@@ -68,8 +78,8 @@ class GitHub:
             return
 
         try:
-            with open(filename, "w") as json_file:
-                json.dump(data, json_file, indent=4)
+            with open(filename, "wb") as json_file:
+                json_file.write(data)
             # Optional: print confirmation
             # print(f"Saved {filename}")
         except OSError as e:
@@ -81,22 +91,22 @@ class GitHub:
         """
         Fetch recent public events for a user and save to file.
         """
-        data = self._get(f"users/{username}/events")
-        self._save_json(data, file_name)
+        data = self._get_bytes(f"users/{username}/events")
+        self._save_bytes(data, file_name)
 
     def get_user_details(self, username, file_name):
         """
         Fetch basic user profile details and save to file.
         """
-        data = self._get(f"users/{username}")
-        self._save_json(data, file_name)
+        data = self._get_bytes(f"users/{username}")
+        self._save_bytes(data, file_name)
 
     def fetch_user_repositories(self, username, file_name):
         """
         Fetch public repositories for a user and save to file.
         """
-        data = self._get(f"users/{username}/repos")
-        self._save_json(data, file_name)
+        data = self._get_bytes(f"users/{username}/repos")
+        self._save_bytes(data, file_name)
 
     # ---------------- Printing / analysis methods ---------------- #
 
@@ -130,11 +140,13 @@ class GitHub:
             return []
         return data
 
-    def print_public_repo(self):
+    def print_public_repo(self, repos=None):
         """
         Print names of all public repositories.
+        Pass an already loaded repo list to avoid reading the file again.
         """
-        repos = self._load_repo_list()
+        if repos is None:
+            repos = self._load_repo_list()
         if not repos:
             return
 
@@ -144,11 +156,13 @@ class GitHub:
             if not repo.get("private", True):
                 print(f"- {repo.get('name')}")
 
-    def print_number_of_stars(self):
+    def print_number_of_stars(self, repos=None):
         """
         Print each public repo with its number of stars and language.
+        Pass an already loaded repo list to avoid reading the file again.
         """
-        repos = self._load_repo_list()
+        if repos is None:
+            repos = self._load_repo_list()
         if not repos:
             return
 
@@ -160,21 +174,20 @@ class GitHub:
                 language = repo.get("language") or "Unknown"
                 print(f"- {name}  ⭐ {stars}  ({language})")
 
-    def printing_languages(self):
+    def printing_languages(self, repos=None):
         """
         Count how many repos use each language and print the summary.
+        Pass an already loaded repo list to avoid reading the file again.
         """
-        repos = self._load_repo_list()
+        if repos is None:
+            repos = self._load_repo_list()
         if not repos:
             return
 
-        language_counts = {}
-        for repo in repos:
-            language = repo.get("language")
-            if language is None:
-                # Skip repos with no detected language
-                continue
-            language_counts[language] = language_counts.get(language, 0) + 1
+        # Counter does the counting loop in C; repos with no detected language are skipped
+        language_counts = Counter(
+            repo.get("language") for repo in repos if repo.get("language") is not None
+        )
 
         print("\n=== Language Usage in Repositories ===")
         if not language_counts:
@@ -198,16 +211,25 @@ def main():
 
     github = GitHub()
 
-    # Fetch and save data
-    github.get_user_activity(username, git_activity)
-    github.get_user_details(username, git_details)
-    github.fetch_user_repositories(username, git_repo_list)
+    # Fetch and save data (the three requests are independent, so run them in parallel)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(github.get_user_activity, username, git_activity),
+            executor.submit(github.get_user_details, username, git_details),
+            executor.submit(github.fetch_user_repositories, username, git_repo_list),
+        ]
+        for future in futures:
+            # Re-raise any unexpected error (e.g. no network) from the worker thread
+            future.result()
 
     # Print summary based on saved data
     github.print_details()
-    github.print_public_repo()
-    github.print_number_of_stars()
-    github.printing_languages()
+
+    # Read and parse the repo list once and share it between the three reports
+    repos = github._load_repo_list()
+    github.print_public_repo(repos)
+    github.print_number_of_stars(repos)
+    github.printing_languages(repos)
 
 
 if __name__ == "__main__":
@@ -12,6 +12,9 @@ class NumberGuessGame:
     - Player tries to guess within the allowed chances
     """
 
+    # Hints indexed by how far off the guess is: <= 5, <= 15, further
+    CLOSE_HINTS = ("🔥 Very close!", "🙂 Getting closer.", "🥶 Very far away.")
+
     def __init__(self):
         pass
 
@@ -22,12 +25,18 @@ class NumberGuessGame:
         Print a hint about how close the guess is to the actual number.
         """
         diff = abs(human_number - computer_number)
-        if diff <= 5:
-            print("🔥 Very close!")
-        elif diff <= 15:
-            print("🙂 Getting closer.")
-        else:
-            print("🥶 Very far away.")
+        # Each True adds 1, giving index 0, 1 or 2 without branching
+        print(self.CLOSE_HINTS[(diff > 5) + (diff > 15)])
+
+    def evaluate_guess(self, human_number: int, computer_number: int) -> int:
+        """
+        Compare a guess to the secret number.
+        Returns:
+            - 1: guess is too high
+            - -1: guess is too low
+            - 0: guess is correct
+        """
+        return (human_number > computer_number) - (human_number < computer_number)
 
     def get_number_range(self) -> tuple[int, int]:
         """
@@ -94,10 +103,11 @@ class NumberGuessGame:
             number_of_guesses += 1
 
             # Compare guess to secret number and give feedback
-            if human_number > computer_num:
+            result = self.evaluate_guess(human_number, computer_num)
+            if result > 0:
                 print("Incorrect! The number is LESS than your guess.")
                 self.check_close(human_number, computer_num)
-            elif human_number < computer_num:
+            elif result < 0:
                 print("Incorrect! The number is GREATER than your guess.")
                 self.check_close(human_number, computer_num)
             else:
@@ -112,6 +122,19 @@ class NumberGuessGame:
         print(f"The correct number was: {computer_num}")
         return None  # lost the game
 
+    def play_round_batch(self, guesses: list[int], computer_num: int, chances: int) -> int | None:
+        """
+        Play one round without any input() or print() calls,
+        e.g. for bots, tests, or benchmarks.
+        The guesses must already be valid integers.
+        Returns the same values as play_round().
+        """
+        for number_of_guesses, human_number in enumerate(guesses[:chances], start=1):
+            if self.evaluate_guess(human_number, computer_num) == 0:
+                return number_of_guesses  # won the game
+
+        return None  # lost the game
+
     def get_difficulty(self) -> int:
         """
         Ask the user for difficulty and return number of chances.
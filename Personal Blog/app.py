@@ -8,16 +8,49 @@ It also includes simple HTTP Basic Authentication for admin routes.
 """
 
 from flask import Flask, render_template, request, abort, redirect, url_for, Response
+from jinja2 import FileSystemBytecodeCache
 from pathlib import Path
+import hmac
 import json
+import os
 import re
-from functools import wraps
+import threading
+from functools import lru_cache, wraps
+
+try:
+    import fcntl  # file locking between worker processes (not available on Windows)
+except ImportError:
+    fcntl = None
+
+try:
+    import orjson  # optional, much faster JSON encoder
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 
+# Keep compiled templates on disk so a restarted worker doesn't re-parse them
+JINJA_CACHE_DIR = Path(__file__).parent / ".jinja_cache"
+JINJA_CACHE_DIR.mkdir(exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(str(JINJA_CACHE_DIR))
+
 # Path where all article JSON files are stored
 ARTICLES_DIR = Path(__file__).parent / "articles"
 
+# Only allow safe filename characters in slugs (compiled once at import)
+SLUG_RE = re.compile(r"[A-Za-z0-9_\-]+")
+
+# Trailing number of an article filename, e.g. "article12" → "12"
+NUM_RE = re.compile(r"(\d+)$")
+
+# Stores the next free article number so new articles don't need a folder scan
+COUNTER_FILE = ARTICLES_DIR / ".next_id"
+_counter_lock = threading.Lock()
+
+# Cache for load_all_articles(): (mtimes key, parsed list), swapped in as one tuple
+# so a concurrent request never pairs a new key with an old list
+_article_cache = (None, [])
+
 
 # -------------------------------------------------------------------
 # BASIC AUTHENTICATION SETUP
@@ -30,7 +63,12 @@ ADMIN_PASSWORD = "secret"
 
 def check_auth(username, password):
     """Return True if the provided credentials match admin credentials."""
-    return username == ADMIN_USERNAME and password == ADMIN_PASSWORD
+    # compare_digest takes the same time whether the first or last character differs,
+    # and "&" (not "and") makes sure both checks always run.
+    # Values are encoded because compare_digest only accepts ASCII str.
+    username_ok = hmac.compare_digest((username or "").encode(), ADMIN_USERNAME.encode())
+    password_ok = hmac.compare_digest((password or "").encode(), ADMIN_PASSWORD.encode())
+    return username_ok & password_ok
 
 
 def authenticate():
@@ -68,19 +106,40 @@ def requires_auth(f):
 # ARTICLE LOADING / READING HELPERS
 # -------------------------------------------------------------------
 
-def read_json(path: Path) -> dict | None:
+def read_json(path: str | Path) -> dict | None:
     """Load a JSON file and return its content as a Python dictionary."""
     try:
-        text = path.read_text(encoding="utf-8")
-        return json.loads(text)
+        with open(path, encoding="utf-8") as f:
+            return json.loads(f.read())
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print("JSON Error:", e)
         return None
 
 
-def make_slug(path: Path) -> str:
+def dump_json(data: dict) -> bytes:
+    """
+    Encode article data as indented UTF-8 JSON bytes.
+    Uses orjson when it is installed, otherwise the standard json module.
+    """
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_article(path: Path, data: dict) -> None:
+    """
+    Save article data to path without ever leaving a half-written file.
+    The JSON is written to a temporary file first, then renamed over the
+    real file in one step (os.replace).
+    """
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_bytes(dump_json(data))
+    os.replace(tmp, path)
+
+
+def make_slug(filename: str) -> str:
     """Return the filename (without extension) as the article slug."""
-    return path.stem
+    return os.path.splitext(filename)[0]
 
 
 def normalize_json(raw_json: dict, slug_from_file: str) -> dict:
@@ -101,46 +160,91 @@ def normalize_json(raw_json: dict, slug_from_file: str) -> dict:
     }
 
 
+def list_article_files() -> list[os.DirEntry]:
+    """
+    Return the article JSON files in ARTICLES_DIR, sorted by name.
+    Uses a single os.scandir() pass instead of globbing and stat'ing paths.
+    """
+    with os.scandir(ARTICLES_DIR) as entries:
+        files = [e for e in entries if e.name.endswith(".json") and e.is_file()]
+    return sorted(files, key=lambda e: e.name)
+
+
+def articles_cache_key(files: list[os.DirEntry]) -> tuple[int, int]:
+    """
+    Return a cheap fingerprint of the articles folder.
+    - The folder mtime changes when a file is added or deleted.
+    - The newest file mtime changes when an article is edited.
+    """
+    newest = max((e.stat().st_mtime_ns for e in files), default=0)
+    return ARTICLES_DIR.stat().st_mtime_ns, newest
+
+
 def load_all_articles():
     """
     Load ALL articles from the ARTICLES_DIR folder.
     Returns a list of normalized article dictionaries.
+    Files are only re-read when something in the folder has changed.
     """
+    global _article_cache
     articles = []
 
     if not ARTICLES_DIR.exists():
         print("The articles/ directory does not exist.")
         return articles
 
-    for json_file in sorted(ARTICLES_DIR.glob("*.json")):
-        raw_json = read_json(json_file)
+    files = list_article_files()
+    key = articles_cache_key(files)
+    cached_key, cached_articles = _article_cache
+    if cached_key == key:
+        return cached_articles
+
+    for entry in files:
+        raw_json = read_json(entry.path)
         if raw_json is None:
             continue
 
-        slug = make_slug(json_file)
+        slug = make_slug(entry.name)
         articles.append(normalize_json(raw_json, slug))
 
+    _article_cache = (key, articles)
     return articles
 
 
+@lru_cache(maxsize=128)
+def read_article(file: Path, slug: str, mtime_ns: int) -> dict | None:
+    """
+    Read and normalize one article file.
+    Cached per (file, mtime), so an edited file is read again automatically.
+    """
+    raw_json = read_json(file)
+    if raw_json is None:
+        return None
+
+    return normalize_json(raw_json, slug)
+
+
 def load_article(slug: str) -> dict | None:
     """
     Load a single article by slug.
     Returns None if slug is invalid or file does not exist.
     """
     # Only allow safe filename characters
-    if not re.fullmatch(r"[A-Za-z0-9_\-]+", slug):
+    if not SLUG_RE.fullmatch(slug):
         return None
 
     file = ARTICLES_DIR / f"{slug}.json"
-    if not file.exists():
+    try:
+        mtime_ns = file.stat().st_mtime_ns
+    except FileNotFoundError:
         return None
 
-    raw_json = read_json(file)
-    if raw_json is None:
+    article = read_article(file, slug, mtime_ns)
+    if article is None:
         return None
 
-    return normalize_json(raw_json, slug)
+    # Return a copy so callers (e.g. the edit route) can't modify the cached dict
+    return dict(article)
 
 
 # -------------------------------------------------------------------
@@ -194,26 +298,49 @@ def edit(slug):
 
         # Save updated JSON file
         filepath = ARTICLES_DIR / f"{slug}.json"
-        filepath.write_text(json.dumps(article, indent=2))
+        write_article(filepath, article)
 
         return redirect(url_for("admin"))
 
     return render_template("edit.html", article=article)
 
 
-def calculate_slug() -> str:
+def scan_next_number() -> int:
     """
-    Generate the next article number based on highest existing number.
-    Example: article1.json, article2.json → returns "3".
+    Find the next article number by scanning every file name.
+    Example: article1.json, article2.json → returns 3.
     """
     numbers = []
 
     for file in ARTICLES_DIR.glob("*.json"):
-        match = re.search(r"(\d+)$", file.stem)
+        match = NUM_RE.search(file.stem)
         if match:
             numbers.append(int(match.group(1)))
 
-    next_number = max(numbers) + 1 if numbers else 0
+    return max(numbers) + 1 if numbers else 0
+
+
+def calculate_slug() -> str:
+    """
+    Return the next article number and reserve it in COUNTER_FILE.
+    The folder is only scanned when the counter file is missing/invalid,
+    or when the stored number is already taken (e.g. a file added by hand).
+    """
+    with _counter_lock, open(COUNTER_FILE, "a+") as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)  # released when the file is closed
+
+        f.seek(0)
+        text = f.read().strip()
+        next_number = int(text) if text.isdigit() else scan_next_number()
+
+        if (ARTICLES_DIR / f"article{next_number}.json").exists():
+            next_number = scan_next_number()
+
+        f.seek(0)
+        f.truncate()
+        f.write(str(next_number + 1))
+
     return str(next_number)
 
 
@@ -244,7 +371,7 @@ def new():
 
         # Save file
         file_path = ARTICLES_DIR / f"{slug}.json"
-        file_path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+        write_article(file_path, data)
 
         return redirect(url_for("admin"))
 
@@ -255,7 +382,7 @@ def new():
 @requires_auth
 def delete(slug):
     """Delete an article from the filesystem."""
-    if not re.fullmatch(r"[A-Za-z0-9_\-]+", slug):
+    if not SLUG_RE.fullmatch(slug):
         abort(400)
 
     file = ARTICLES_DIR / f"{slug}.json"
@@ -1,7 +1,17 @@
+import os
+import re
+from functools import lru_cache
+
 from flask import Flask, render_template, request
+from jinja2 import FileSystemBytecodeCache
 
 app = Flask(__name__)
 
+# Keep compiled templates on disk so a restarted worker doesn't re-parse them
+JINJA_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".jinja_cache")
+os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_DIR)
+
 # ------------------------------
 # Conversion tables / logic
 # ------------------------------
@@ -17,23 +27,35 @@ UNIT_TO_METER = {
     "yd": 0.9144
 }
 
+# Precomputed from/to factors: LENGTH_FACTOR[a][b] = UNIT_TO_METER[a] / UNIT_TO_METER[b]
+LENGTH_FACTOR = {
+    u: {v: UNIT_TO_METER[u] / UNIT_TO_METER[v] for v in UNIT_TO_METER}
+    for u in UNIT_TO_METER
+}
+
 
 def convert_length(value, unit_from, unit_to):
     """
     Convert a length from unit_from to unit_to via meters.
     Raises ValueError if units are not supported.
     """
-    unit_from = unit_from.lower().strip()
-    unit_to = unit_to.lower().strip()
+    return _convert_length(value, unit_from.lower().strip(), unit_to.lower().strip())
+
 
-    if unit_from not in UNIT_TO_METER or unit_to not in UNIT_TO_METER:
+@lru_cache(maxsize=1024)
+def _convert_length(value, unit_from, unit_to):
+    """
+    Cached core of convert_length(); units are already lowercased and stripped.
+    Popular conversions (1 m → ft, 100 cm → in, ...) become a cache hit.
+    """
+    # .get() checks and fetches in one lookup (None means unsupported unit)
+    factors = LENGTH_FACTOR.get(unit_from)
+    factor = factors.get(unit_to) if factors else None
+    if factor is None:
         raise ValueError("Unsupported unit. Try: m, cm, mm, km, in, ft, yd")
 
-    # Step 1: convert input value to meters
-    value_in_meters = value * UNIT_TO_METER[unit_from]
-    # Step 2: convert meters to target unit
-    result = value_in_meters / UNIT_TO_METER[unit_to]
-    return result
+    # One multiply: the "to meters, then to target unit" factor is precomputed
+    return value * factor
 
 
 # Weight: all units relative to 1 kilogram
@@ -45,23 +67,48 @@ UNIT_TO_KG = {
     "oz": 0.0283495,
 }
 
+# Precomputed from/to factors: WEIGHT_FACTOR[a][b] = UNIT_TO_KG[a] / UNIT_TO_KG[b]
+WEIGHT_FACTOR = {
+    u: {v: UNIT_TO_KG[u] / UNIT_TO_KG[v] for v in UNIT_TO_KG}
+    for u in UNIT_TO_KG
+}
+
 
 def weight_convert(value, unit_from, unit_to):
     """
     Convert a weight from unit_from to unit_to via kilograms.
     Raises ValueError if units are not supported.
     """
-    unit_from = unit_from.lower().strip()
-    unit_to = unit_to.lower().strip()
+    return _weight_convert(value, unit_from.lower().strip(), unit_to.lower().strip())
 
-    if unit_from not in UNIT_TO_KG or unit_to not in UNIT_TO_KG:
+
+@lru_cache(maxsize=1024)
+def _weight_convert(value, unit_from, unit_to):
+    """
+    Cached core of weight_convert(); units are already lowercased and stripped.
+    """
+    # .get() checks and fetches in one lookup (None means unsupported unit)
+    factors = WEIGHT_FACTOR.get(unit_from)
+    factor = factors.get(unit_to) if factors else None
+    if factor is None:
         raise ValueError("Unsupported unit. Try: kg, g, mg, lb, oz")
 
-    # Step 1: convert to kg
-    value_in_kg = value * UNIT_TO_KG[unit_from]
-    # Step 2: convert kg to target unit
-    result = value_in_kg / UNIT_TO_KG[unit_to]
-    return result
+    # One multiply: the "to kg, then to target unit" factor is precomputed
+    return value * factor
+
+
+# Temperature: one formula per (from, to) pair, so a conversion is a single lookup
+TEMP_CONVERT = {
+    ("c", "c"): lambda v: v,
+    ("c", "f"): lambda v: v * (9 / 5) + 32,
+    ("c", "k"): lambda v: v + 273.15,
+    ("f", "c"): lambda v: (v - 32) * (5 / 9),
+    ("f", "f"): lambda v: v,
+    ("f", "k"): lambda v: (v - 32) * (5 / 9) + 273.15,
+    ("k", "c"): lambda v: v - 273.15,
+    ("k", "f"): lambda v: (v - 273.15) * (9 / 5) + 32,
+    ("k", "k"): lambda v: v,
+}
 
 
 def convert_temp(value, unit_from, unit_to):
@@ -69,32 +116,19 @@ def convert_temp(value, unit_from, unit_to):
     Convert temperature between Celsius (c), Fahrenheit (f), and Kelvin (k).
     Raises ValueError if units are not supported.
     """
-    unit_from = unit_from.lower().strip()
-    unit_to = unit_to.lower().strip()
+    return _convert_temp(value, unit_from.lower().strip(), unit_to.lower().strip())
 
-    # If both units are same, no conversion needed
-    if unit_from == unit_to:
-        return value
 
-    # Convert from source unit to Celsius
-    if unit_from == "c":
-        c = value
-    elif unit_from == "f":
-        c = (value - 32) * (5 / 9)
-    elif unit_from == "k":
-        c = value - 273.15
-    else:
+@lru_cache(maxsize=1024)
+def _convert_temp(value, unit_from, unit_to):
+    """
+    Cached core of convert_temp(); units are already lowercased and stripped.
+    """
+    convert = TEMP_CONVERT.get((unit_from, unit_to))
+    if convert is None:
         raise ValueError("Unsupported unit. Try: c, f, k")
 
-    # Convert from Celsius to target unit
-    if unit_to == "c":
-        return c
-    elif unit_to == "f":
-        return c * (9 / 5) + 32
-    elif unit_to == "k":
-        return c + 273.15
-    else:
-        raise ValueError("Unsupported unit. Try: c, f, k")
+    return convert(value)
 
 
 # ------------------------------
@@ -120,88 +154,26 @@ def index():
     )
 
 
-@app.route("/convert_length", methods=["POST"])
-def do_length():
-    """
-    Handle length conversion form submit.
-    """
-    length_str = (request.form.get("length") or "").strip()
-    unit_from = (request.form.get("unit_from") or "").strip()
-    unit_to = (request.form.get("unit_to") or "").strip()
-
-    error = None
-    result = None
-    show_result = False
-    value = None
+# A plain decimal number such as 12, -3.5, .5 or 1e3 (checked before calling float())
+NUMBER_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
 
-    # Validate that a value was entered
-    if not length_str:
-        error = "Please enter a length value."
-    else:
-        try:
-            value = float(length_str)
-            result = convert_length(value, unit_from, unit_to)
-            show_result = True
-        except ValueError as e:
-            # This catches invalid units and invalid numbers
-            error = str(e)
-            show_result = False
-
-    return render_template(
-        "index.html",
-        measurement="length",
-        result=result,
-        error=error,
-        show_result=show_result,
-        unit_to=unit_to,
-        value=value,
-        unit_from=unit_from,
-    )
+# Per measurement: (convert function, form field name, message for an empty value)
+CONVERTERS = {
+    "length": (convert_length, "length", "Please enter a length value."),
+    "weight": (weight_convert, "weight", "Please enter a weight value."),
+    "temp": (convert_temp, "temp", "Please enter a temperature value."),
+}
 
 
-@app.route("/convert_weight", methods=["POST"])
-def do_weight():
+@app.route("/convert_<any(length, weight, temp):kind>", methods=["POST"])
+def do_convert(kind):
     """
-    Handle weight conversion form submit.
+    Handle the length, weight and temperature conversion form submits
+    (/convert_length, /convert_weight, /convert_temp).
     """
-    weight_str = (request.form.get("weight") or "").strip()
-    unit_from = (request.form.get("unit_from") or "").strip()
-    unit_to = (request.form.get("unit_to") or "").strip()
+    convert, field, empty_error = CONVERTERS[kind]
 
-    error = None
-    result = None
-    show_result = False
-    value = None
-
-    if not weight_str:
-        error = "Please enter a weight value."
-    else:
-        try:
-            value = float(weight_str)
-            result = weight_convert(value, unit_from, unit_to)
-            show_result = True
-        except ValueError as e:
-            error = str(e)
-            show_result = False
-
-    return render_template(
-        "index.html",
-        measurement="weight",
-        result=result,
-        unit_to=unit_to,
-        error=error,
-        show_result=show_result,
-        value=value,
-        unit_from=unit_from,
-    )
-
-
-@app.route("/convert_temp", methods=["POST"])
-def do_temp():
-    """
-    Handle temperature conversion form submit.
-    """
-    temp_str = (request.form.get("temp") or "").strip()
+    value_str = (request.form.get(field) or "").strip()
     unit_from = (request.form.get("unit_from") or "").strip()
     unit_to = (request.form.get("unit_to") or "").strip()
 
@@ -210,24 +182,28 @@ def do_temp():
     show_result = False
     value = None
 
-    if not temp_str:
-        error = "Please enter a temperature value."
+    # Validate that a number was entered before converting it,
+    # so only the unit check below needs a try/except
+    if not value_str:
+        error = empty_error
+    elif not NUMBER_RE.fullmatch(value_str):
+        error = "Please enter a valid number."
     else:
+        value = float(value_str)
         try:
-            value = float(temp_str)
-            result = convert_temp(value, unit_from, unit_to)
+            result = convert(value, unit_from, unit_to)
             show_result = True
         except ValueError as e:
+            # This catches invalid units
             error = str(e)
-            show_result = False
 
     return render_template(
         "index.html",
-        measurement="temp",
+        measurement=kind,
         result=result,
         error=error,
-        unit_to=unit_to,
         show_result=show_result,
+        unit_to=unit_to,
         value=value,
         unit_from=unit_from,
     )
@@ -1,31 +1,60 @@
 # Importing required modules
 from flask import Flask, request, render_template
+from jinja2 import FileSystemBytecodeCache
 import redis
 import requests
 from dotenv import load_dotenv
+from dataclasses import dataclass
 import os
-import json
 
 # Initialize Flask application
 app = Flask(__name__)
 
+# Keep compiled templates on disk so a restarted worker doesn't re-parse them
+JINJA_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".jinja_cache")
+os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_DIR)
+
 # Load environment variables from .env
 load_dotenv()
 
 """
 Retrieve environment variables:
 - API_KEY          : OpenWeather API key
-- REDIS_NAME       : Hostname of Redis server (usually 'localhost')
+- REDIS_NAME       : Hostname of Redis server (default 'localhost')
 - REDIS_PORT       : Port Redis is running on (default 6379)
-- CACHE_TIME       : How long weather data should stay cached (in seconds)
+- CACHE_TIME       : How long weather data should stay cached (in seconds, default 300)
 - BASE_URL         : OpenWeather API base URL
+
+They are read and validated once at startup into a frozen Config object.
 """
+@dataclass(frozen=True, slots=True)
+class Config:
+    api_key: str | None
+    redis_host: str
+    redis_port: int
+    cache_time: int
+    url: str | None
+
+
+def env_int(key, default):
+    """Read an integer environment variable, with a clear error if it is not a number."""
+    value = os.getenv(key)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise RuntimeError(f"{key} must be an integer, got {value!r}") from None
+
 
-API_KEY    = os.getenv("API_KEY")
-name       = os.getenv("REDIS_NAME")
-port_num   = int(os.getenv("REDIS_PORT"))
-cache_time = int(os.getenv("CACHE_TIME"))
-url        = os.getenv("BASE_URL")
+CFG = Config(
+    api_key=os.getenv("API_KEY"),
+    redis_host=os.getenv("REDIS_NAME") or "localhost",
+    redis_port=env_int("REDIS_PORT", 6379),
+    cache_time=env_int("CACHE_TIME", 300),
+    url=os.getenv("BASE_URL"),
+)
 
 """
 Create Redis client object that connects to Redis server.
@@ -36,7 +65,20 @@ Parameters:
 - db    : Database index (0 is default)
 - decode_responses=True ensures Redis returns strings instead of bytes
 """
-client = redis.Redis(host=name, port=port_num, db=0, decode_responses=True)
+client = redis.Redis(host=CFG.redis_host, port=CFG.redis_port, db=0, decode_responses=True)
+
+
+"""
+Create one shared HTTP session for OpenWeather API calls.
+
+Reusing the session keeps TCP/TLS connections alive between cache misses
+instead of doing a new handshake for every request. The connection pool
+is sized so concurrent Flask workers can each hold a connection.
+"""
+session = requests.Session()
+adapter = requests.adapters.HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=1)
+session.mount("https://", adapter)
+session.mount("http://", adapter)
 
 
 """
@@ -54,29 +96,34 @@ This function:
 Parameters:
 - city     : city name in lowercase
 - country  : country name in lowercase
+- cfg      : settings to use (defaults to the app's CFG)
 """
-def fetch_weather(city, country):
+def fetch_weather(city, country, cfg=CFG):
 
     # Create a unique cache key for the city-country combination
-    cache_key = f"weather:{city},{country}"
+    # ("hash" keeps it apart from older entries stored as JSON strings)
+    cache_key = f"weather:hash:{city},{country}"
 
-    # Attempt to fetch cached data
-    cached_data = client.get(cache_key)
+    # Attempt to fetch cached data (stored as a Redis hash, so no JSON decoding)
+    cached_data = client.hgetall(cache_key)
     if cached_data:
         print("[From cache]\n")
-        data = json.loads(cached_data)  # Convert JSON string back to dict
-        print(data)
-        return data
+        print(cached_data)
+        return cached_data
 
     # API parameters for requesting weather data
     params = {
         'q': f"{city},{country}",
-        'appid': API_KEY,
+        'appid': cfg.api_key,
         'units': "metric"
     }
 
-    # Make API call to OpenWeather
-    response = requests.get(url, params=params)
+    # Make API call to OpenWeather (through the shared keep-alive session)
+    try:
+        response = session.get(cfg.url, params=params, timeout=5)
+    except requests.RequestException as e:
+        print("API Error:", e)
+        return None
 
     # If API returns error
     if response.status_code != 200:
@@ -99,8 +146,13 @@ def fetch_weather(city, country):
     print("[From API]\n")
     print(data)
 
-    # Store processed data in Redis with expiration time
-    client.setex(cache_key, cache_time, json.dumps(data))
+    # Store processed data in Redis as a hash with expiration time.
+    # Both commands go in one pipeline, so this is a single round-trip.
+    # Hash values are strings; the template only displays them.
+    pipe = client.pipeline()
+    pipe.hset(cache_key, mapping={k: str(v) for k, v in data.items()})
+    pipe.expire(cache_key, cfg.cache_time)
+    pipe.execute()
 
     return data
 
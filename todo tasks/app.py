@@ -1,46 +1,125 @@
 import sys          # to read command-line arguments
-import os           # to check if the JSON file exists
+import os           # to check if the log file exists
 import json         # to read/write JSON data
 from datetime import datetime  # to store created/updated timestamps
 
-# Name of the JSON file used to store all tasks
-task_list = 'tasklist.json'
+# Name of the log file used to store all tasks.
+# Each line is one JSON event: {"op": "add" | "update" | "delete", ...}
+task_list = 'tasklist.log'
+
+# Older versions stored all tasks as a single JSON array in this file
+legacy_task_list = 'tasklist.json'
 
 
 class Tasklist:
     def __init__(self):
-        # Load existing tasks from JSON (or start with an empty list)
+        # Load existing tasks into a dict keyed by ID (or start with an empty dict)
         self.task = self.load_tasks()
+        # Next free ID, so get_id() doesn't have to scan every task
+        self._next_id = max(self.task, default=0) + 1
 
     def load_tasks(self):
         """
-        Load tasks from the JSON file.
+        Load tasks by replaying the event log.
+
+        - If the log doesn't exist, convert the old tasklist.json (if any)
+          or create an empty log, and return the tasks.
+        - If an event is invalid JSON (e.g. a half-written last line after
+          a crash), skip just that line and rewrite the log without it.
+        - If the log has grown to more than twice the number of tasks,
+          compact it.
 
-        - If the file doesn't exist, create it with an empty list and return [].
-        - If the file exists but is empty or invalid JSON, reset it to [].
+        Returns a dict of tasks keyed by ID, in the order they were added.
         """
         if not os.path.exists(task_list):
-            with open(task_list, 'w') as f:
-                json.dump([], f, indent=4)
-            return []
+            return self.migrate_legacy_tasks()
+
+        task = {}  # id -> task
+        line_count = 0
+        bad_lines = 0
+
+        # Read the whole log in one call; json.loads parses bytes directly
+        with open(task_list, 'rb') as f:
+            content = f.read()
+        lines = content.splitlines()
+
+        # If the last event has no newline, add one now so the next
+        # save_event() doesn't glue its event onto that line
+        if content and not content.endswith(b'\n'):
+            with open(task_list, 'ab') as f:
+                f.write(b'\n')
+
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                # Torn/corrupted event → skip only this line
+                bad_lines += 1
+                continue
+            line_count += 1
+
+            if event['op'] == 'add':
+                task[event['task']['id']] = event['task']
+            elif event['op'] == 'update' and event['id'] in task:
+                task[event['id']].update(event['changes'])
+            elif event['op'] == 'delete':
+                task.pop(event['id'], None)
+
+        if bad_lines:
+            print(f"Warning: skipped {bad_lines} corrupted line(s) in {task_list}.")
+            self.compact(task)
+        elif line_count > 2 * len(task):
+            self.compact(task)
+        return task
+
+    def migrate_legacy_tasks(self):
+        """
+        Convert the old tasklist.json (a JSON array) into the event log.
+
+        If there is no old file, or it is empty/invalid, start with an empty log.
+        """
+        tasks = []
+        if os.path.exists(legacy_task_list):
+            try:
+                with open(legacy_task_list, 'r') as f:
+                    tasks = json.load(f)
+            except json.JSONDecodeError:
+                tasks = []
+
+        task = {t['id']: t for t in tasks}
+        self.compact(task)
+        return task
+
+    def compact(self, task):
+        """
+        Rewrite the log so it only holds one 'add' event per existing task.
 
-        try:
-            with open(task_list, 'r') as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            # File exists but is empty or corrupted → reset to an empty list
-            with open(task_list, 'w') as f:
-                json.dump([], f, indent=4)
-            return []
+        The new log is written to a temporary file first and then swapped in,
+        so a crash can never leave a half-written log behind.
+        """
+        tmp_file = task_list + '.tmp'
+        with open(tmp_file, 'w') as f:
+            f.write(''.join(json.dumps({'op': 'add', 'task': t}) + '\n' for t in task.values()))
+        os.replace(tmp_file, task_list)
+
+    def save_event(self, *events):
+        """
+        Append one or more changes to the log (in a single write).
 
-    def save_tasks(self):
+        Only the changes are written, so saving no longer gets slower
+        as the task list grows.
         """
-        Save the in-memory task list (self.task) back into the JSON file.
+        with open(task_list, 'a') as f:
+            f.write(''.join(json.dumps(event) + '\n' for event in events))
 
-        JSON cannot be updated "in-place", so we rewrite the whole file each time.
+    def now(self):
         """
-        with open(task_list, 'w') as f:
-            json.dump(self.task, f, indent=4)
+        Current time as an ISO string, to the second.
+        Mutators call this once and reuse the value for every field they set.
+        """
+        return datetime.now().isoformat(timespec='seconds')
 
     def get_id(self):
         """
@@ -48,64 +127,76 @@ class Tasklist:
 
         - If there are no tasks, start IDs from 1.
         - Otherwise, return max(existing_ids) + 1.
+
+        Each call hands out a new ID (the counter moves forward).
         """
-        if not self.task:
-            return 1
-        return max(task['id'] for task in self.task) + 1
+        new_id = self._next_id
+        self._next_id += 1
+        return new_id
 
     def add_task(self, task):
         """
         Add a new task with a unique ID, default status 'to-do',
         and timestamps for creation and last update.
         """
-        new_id = self.get_id()
-        now = datetime.now().isoformat()
+        self.add_tasks([task])
 
-        new_task = {
-            'id': new_id,
-            'name': task,
-            'status': 'to-do',
-            'created_on': now,
-            'updated_on': now,
-        }
+    def add_tasks(self, tasks):
+        """
+        Add several tasks at once (e.g. a bulk import).
+
+        The clock is read once for the whole batch and all new tasks
+        are appended to the log in a single write.
+        """
+        now = self.now()
+        events = []
 
-        # Add the new task to the in-memory list
-        self.task.append(new_task)
+        for task in tasks:
+            new_id = self.get_id()
+            new_task = {
+                'id': new_id,
+                'name': task,
+                'status': 'to-do',
+                'created_on': now,
+                'updated_on': now,
+            }
 
-        # Persist updated list to the JSON file
-        self.save_tasks()
+            # Add the new task to the in-memory dict
+            self.task[new_id] = new_task
+            events.append({'op': 'add', 'task': new_task})
 
-        print(f"Task added successfully ID({new_id})")
+        # Persist the new tasks to the log
+        self.save_event(*events)
+
+        for event in events:
+            print(f"Task added successfully ID({event['task']['id']})")
 
     def delete_task(self, task_id):
         """
         Delete a task by its ID.
         """
         task_id = int(task_id)
-        for task in self.task:
-            if task['id'] == task_id:
-                self.task.remove(task)
-                self.save_tasks()
-                print(f"Task deleted successfully ID({task_id})")
-                return
+        if self.task.pop(task_id, None) is None:
+            print(f"No task found with ID({task_id})")
+            return
 
-        # If we reach here, no task matched the given ID
-        print(f"No task found with ID({task_id})")
+        self.save_event({'op': 'delete', 'id': task_id})
+        print(f"Task deleted successfully ID({task_id})")
 
     def update_task(self, task_id, task_name):
         """
         Update the name of a task by its ID and refresh its 'updated_on' timestamp.
         """
         task_id = int(task_id)
-        for task in self.task:
-            if task['id'] == task_id:
-                task['name'] = task_name
-                task['updated_on'] = datetime.now().isoformat()
-                self.save_tasks()
-                print(f"Task updated successfully ID({task_id})")
-                return
+        task = self.task.get(task_id)
+        if task is None:
+            print(f"No task found with ID({task_id})")
+            return
 
-        print(f"No task found with ID({task_id})")
+        changes = {'name': task_name, 'updated_on': self.now()}
+        task.update(changes)
+        self.save_event({'op': 'update', 'id': task_id, 'changes': changes})
+        print(f"Task updated successfully ID({task_id})")
 
     def list_tasks(self):
         """
@@ -115,7 +206,7 @@ class Tasklist:
             print("No tasks found.")
             return
 
-        for task in self.task:
+        for task in self.task.values():
             print(task['name'])
 
     def mark_in_progress(self, task_id):
@@ -123,30 +214,30 @@ class Tasklist:
         Mark a task as 'in-progress' by its ID.
         """
         task_id = int(task_id)
-        for task in self.task:
-            if task['id'] == task_id:
-                task['status'] = 'in-progress'
-                task['updated_on'] = datetime.now().isoformat()
-                self.save_tasks()
-                print(f"Task is marked as in-progress ID({task_id})")
-                return
+        task = self.task.get(task_id)
+        if task is None:
+            print(f"No task found with ID({task_id})")
+            return
 
-        print(f"No task found with ID({task_id})")
+        changes = {'status': 'in-progress', 'updated_on': self.now()}
+        task.update(changes)
+        self.save_event({'op': 'update', 'id': task_id, 'changes': changes})
+        print(f"Task is marked as in-progress ID({task_id})")
 
     def mark_done(self, task_id):
         """
         Mark a task as 'done' by its ID.
         """
         task_id = int(task_id)
-        for task in self.task:
-            if task['id'] == task_id:
-                task['status'] = 'done'
-                task['updated_on'] = datetime.now().isoformat()
-                self.save_tasks()
-                print(f"Task is marked as done ID({task_id})")
-                return
+        task = self.task.get(task_id)
+        if task is None:
+            print(f"No task found with ID({task_id})")
+            return
 
-        print(f"No task found with ID({task_id})")
+        changes = {'status': 'done', 'updated_on': self.now()}
+        task.update(changes)
+        self.save_event({'op': 'update', 'id': task_id, 'changes': changes})
+        print(f"Task is marked as done ID({task_id})")
 
     def list_by_property(self, stat):
         """
@@ -159,14 +250,14 @@ class Tasklist:
             print("Usage: python app.py list <to-do|in-progress|done>")
             return
 
-        found = False
-        for task in self.task:
-            if task['status'] == stat:
-                print(task['name'])
-                found = True
+        names = [task['name'] for task in self.task.values() if task['status'] == stat]
 
-        if not found:
+        if not names:
             print(f"No tasks found with status '{stat}'.")
+            return
+
+        # One write for all matching tasks instead of one print() per task
+        sys.stdout.write('\n'.join(names) + '\n')
 
 
 def main():
@@ -174,7 +265,7 @@ def main():
     Command-line interface handler.
 
     Supported commands:
-      python app.py add <taskname>
+      python app.py add <taskname> [<taskname> ...]
       python app.py delete <taskid>
       python app.py update <taskid> <taskname>
       python app.py list
@@ -191,11 +282,11 @@ def main():
     command = sys.argv[1]
 
     if command == "add":
-        # python app.py add <taskname>  → total args must be 3
-        if len(sys.argv) == 3:
-            tasks.add_task(sys.argv[2])
+        # python app.py add <taskname> [<taskname> ...]  → at least 3 args
+        if len(sys.argv) >= 3:
+            tasks.add_tasks(sys.argv[2:])
         else:
-            print("Usage: python app.py add <taskname>")
+            print("Usage: python app.py add <taskname> [<taskname> ...]")
             sys.exit(1)
 
     elif command == "delete":